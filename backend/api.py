@@ -1,15 +1,29 @@
-from fastapi import FastAPI, HTTPException, Query
+from fastapi import FastAPI, HTTPException, Query, Depends
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 from pydantic import BaseModel
 from typing import Optional, List
 from datetime import datetime, timedelta
+import asyncio
+from functools import lru_cache
+import orjson
 import uvicorn
 
 from .database import TweetDatabase
 from .data_collector import TwitterDataCollector
 from .sentiment_analyzer import SentimentAnalyzer
 
-app = FastAPI(title="Sentiment Analysis API", version="1.0.0")
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson, which also handles numpy scalars and non-str keys."""
+    
+    def render(self, content) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS)
+
+app = FastAPI(
+    title="Sentiment Analysis API",
+    version="1.0.0",
+    default_response_class=ORJSONResponse
+)
 
 # Add CORS middleware
 app.add_middleware(
@@ -20,10 +34,25 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Initialize components
-db = TweetDatabase()
-collector = TwitterDataCollector()
-analyzer = SentimentAnalyzer()
+# Shared components, built once per process and injected into the routes
+@lru_cache(maxsize=1)
+def get_db() -> TweetDatabase:
+    return TweetDatabase()
+
+@lru_cache(maxsize=1)
+def get_collector() -> TwitterDataCollector:
+    return TwitterDataCollector()
+
+@lru_cache(maxsize=1)
+def get_analyzer() -> SentimentAnalyzer:
+    return SentimentAnalyzer()
+
+@app.on_event("startup")
+async def startup():
+    """Initialize the database schema and load the analyzer before serving requests."""
+    get_db()
+    get_collector()
+    get_analyzer()
 
 class KeywordRequest(BaseModel):
     keyword: str
@@ -40,11 +69,17 @@ async def root():
     return {"message": "Sentiment Analysis API for Meghalaya Government"}
 
 @app.post("/collect-tweets")
-async def collect_tweets(request: KeywordRequest):
+async def collect_tweets(
+    request: KeywordRequest,
+    db: TweetDatabase = Depends(get_db),
+    collector: TwitterDataCollector = Depends(get_collector),
+    analyzer: SentimentAnalyzer = Depends(get_analyzer)
+):
     """Collect tweets for a given keyword and store them in the database."""
     try:
         # Collect tweets
-        tweets = collector.collect_tweets(
+        tweets = await asyncio.to_thread(
+            collector.collect_tweets,
             keyword=request.keyword,
             max_tweets=request.max_tweets,
             days_back=request.days_back
@@ -53,16 +88,17 @@ async def collect_tweets(request: KeywordRequest):
         if not tweets:
             raise HTTPException(status_code=404, detail="No tweets found for the given keyword")
         
-        # Analyze sentiment for each tweet
+        # Analyze sentiment for all tweets in one batch
+        contents = [tweet['content'] for tweet in tweets]
+        sentiment_results = await asyncio.to_thread(analyzer.analyze_batch, contents)
+        
         analyzed_tweets = []
-        for tweet in tweets:
-            sentiment_result = analyzer.analyze_sentiment(tweet['content'])
-            
+        for tweet, sentiment_result in zip(tweets, sentiment_results):
             tweet.update(sentiment_result)
             analyzed_tweets.append(tweet)
         
         # Store in database
-        db.insert_tweets(analyzed_tweets)
+        await asyncio.to_thread(db.insert_tweets, analyzed_tweets)
         
         return {
             "message": f"Successfully collected and analyzed {len(analyzed_tweets)} tweets",
@@ -78,18 +114,23 @@ async def get_tweets(
     keyword: Optional[str] = Query(None),
     start_date: Optional[str] = Query(None),
     end_date: Optional[str] = Query(None),
-    limit: Optional[int] = Query(100)
+    limit: Optional[int] = Query(100),
+    exact: bool = Query(False),
+    db: TweetDatabase = Depends(get_db)
 ):
     """Get tweets from the database with optional filters."""
     try:
         start_dt = datetime.fromisoformat(start_date) if start_date else None
         end_dt = datetime.fromisoformat(end_date) if end_date else None
         
-        df = db.get_tweets(keyword=keyword, start_date=start_dt, end_date=end_dt, limit=limit)
+        tweets = await asyncio.to_thread(
+            db.get_tweets, keyword=keyword, start_date=start_dt, end_date=end_dt, limit=limit,
+            as_dicts=True, exact=exact
+        )
         
         return {
-            "tweets": df.to_dict('records'),
-            "total_count": len(df)
+            "tweets": tweets,
+            "total_count": len(tweets)
         }
         
     except Exception as e:
@@ -99,17 +140,21 @@ async def get_tweets(
 async def get_sentiment_distribution(
     keyword: Optional[str] = Query(None),
     start_date: Optional[str] = Query(None),
-    end_date: Optional[str] = Query(None)
+    end_date: Optional[str] = Query(None),
+    exact: bool = Query(False),
+    db: TweetDatabase = Depends(get_db)
 ):
     """Get sentiment distribution for tweets."""
     try:
         start_dt = datetime.fromisoformat(start_date) if start_date else None
         end_dt = datetime.fromisoformat(end_date) if end_date else None
         
-        distribution = db.get_sentiment_distribution(
+        distribution = await asyncio.to_thread(
+            db.get_sentiment_distribution,
             keyword=keyword,
             start_date=start_dt,
-            end_date=end_dt
+            end_date=end_dt,
+            exact=exact
         )
         
         return {"sentiment_distribution": distribution}
@@ -121,38 +166,43 @@ async def get_sentiment_distribution(
 async def get_sentiment_timeline(
     keyword: Optional[str] = Query(None),
     start_date: Optional[str] = Query(None),
-    end_date: Optional[str] = Query(None)
+    end_date: Optional[str] = Query(None),
+    exact: bool = Query(False),
+    db: TweetDatabase = Depends(get_db)
 ):
     """Get sentiment trends over time."""
     try:
         start_dt = datetime.fromisoformat(start_date) if start_date else None
         end_dt = datetime.fromisoformat(end_date) if end_date else None
         
-        df = db.get_sentiment_timeline(
+        timeline_data = await asyncio.to_thread(
+            db.get_sentiment_timeline,
             keyword=keyword,
             start_date=start_dt,
-            end_date=end_dt
+            end_date=end_dt,
+            as_dicts=True,
+            exact=exact
         )
         
         return {
-            "timeline_data": df.to_dict('records')
+            "timeline_data": timeline_data
         }
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error getting sentiment timeline: {str(e)}")
 
 @app.get("/top-keywords")
-async def get_top_keywords(limit: int = Query(20)):
+async def get_top_keywords(limit: int = Query(20), db: TweetDatabase = Depends(get_db)):
     """Get most frequent keywords from tweets."""
     try:
-        keywords = db.get_top_keywords(limit=limit)
+        keywords = await asyncio.to_thread(db.get_top_keywords, limit=limit)
         return {"top_keywords": keywords}
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error getting top keywords: {str(e)}")
 
 @app.post("/export-csv")
-async def export_csv(request: AnalysisRequest):
+async def export_csv(request: AnalysisRequest, db: TweetDatabase = Depends(get_db)):
     """Export tweets to CSV file."""
     try:
         start_dt = datetime.fromisoformat(request.start_date) if request.start_date else None
@@ -161,7 +211,8 @@ async def export_csv(request: AnalysisRequest):
         filename = f"tweets_export_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
         filepath = f"data/{filename}"
         
-        count = db.export_to_csv(
+        count = await asyncio.to_thread(
+            db.export_to_csv,
             filepath=filepath,
             keyword=request.keyword,
             start_date=start_dt,
@@ -5,7 +5,11 @@ from typing import List, Dict, Optional
 import time
 import re
 from bs4 import BeautifulSoup
-import random
+import numpy as np
+
+# Patterns stripped by TwitterDataCollector.clean_tweet_content
+_URL_RE = re.compile(r'(?:http|www)\S+')
+_MENTION_RE = re.compile(r'@\w+')
 
 class TwitterDataCollector:
     def __init__(self):
@@ -34,6 +38,10 @@ class TwitterDataCollector:
                 if i >= max_tweets:
                     break
                 
+                # Pause briefly every 50 tweets to be respectful
+                if i > 0 and i % 50 == 0:
+                    time.sleep(1.0)
+                
                 tweets.append({
                     'tweet_id': str(tweet.id),
                     'content': tweet.rawContent,
@@ -44,9 +52,6 @@ class TwitterDataCollector:
                     'retweet_count': tweet.retweetCount,
                     'like_count': tweet.likeCount
                 })
-                
-                # Add small delay to be respectful
-                time.sleep(0.1)
         
         except ImportError:
             print("snscrape not available, using sample data generator")
@@ -110,37 +115,46 @@ class TwitterDataCollector:
             "shillong_times", "meghalaya_mirror", "tribal_times", "hill_voice"
         ]
         
-        tweets = []
         now = datetime.now()
+        rng = np.random.default_rng()
         
-        for i in range(count):
-            # Randomly select sentiment and template
-            sentiment_choice = random.choices(
-                ['positive', 'negative', 'neutral'], 
-                weights=[0.4, 0.3, 0.3]
-            )[0]
-            
-            if sentiment_choice == 'positive':
-                content = random.choice(positive_templates)
-            elif sentiment_choice == 'negative':
-                content = random.choice(negative_templates)
-            else:
-                content = random.choice(neutral_templates)
-            
-            # Generate random timestamp within last 7 days
-            random_hours = random.randint(0, 7 * 24)
-            created_at = now - timedelta(hours=random_hours)
-            
-            tweets.append({
-                'tweet_id': f"sample_{i}_{int(time.time())}",
-                'content': content,
-                'username': random.choice(usernames),
-                'created_at': created_at.isoformat(),
+        # Randomly select sentiment, then a template within that sentiment
+        template_groups = [positive_templates, negative_templates, neutral_templates]
+        templates = [template for group in template_groups for template in group]
+        group_sizes = np.array([len(group) for group in template_groups])
+        group_offsets = np.cumsum(group_sizes) - group_sizes
+        
+        sentiment_idx = rng.choice(len(template_groups), size=count, p=[0.4, 0.3, 0.3])
+        template_idx = group_offsets[sentiment_idx] + rng.integers(0, group_sizes[sentiment_idx])
+        
+        # Random timestamps within last 7 days and engagement counts
+        random_hours = rng.integers(0, 7 * 24, size=count, endpoint=True)
+        username_idx = rng.integers(0, len(usernames), size=count)
+        retweet_counts = rng.integers(0, 50, size=count, endpoint=True)
+        like_counts = rng.integers(0, 200, size=count, endpoint=True)
+        
+        # Build IDs, URLs and ISO timestamps as whole string arrays
+        indices = np.arange(count).astype(str)
+        tweet_ids = np.char.add(np.char.add('sample_', indices), f"_{int(time.time())}")
+        urls = np.char.add('https://twitter.com/sample/status/', indices)
+        created_at = (np.datetime64(now) - random_hours.astype('timedelta64[h]')).astype(str)
+        
+        tweets = [
+            {
+                'tweet_id': tweet_id,
+                'content': templates[t_idx],
+                'username': usernames[u_idx],
+                'created_at': created,
                 'keyword': keyword,
-                'url': f"https://twitter.com/sample/status/{i}",
-                'retweet_count': random.randint(0, 50),
-                'like_count': random.randint(0, 200)
-            })
+                'url': url,
+                'retweet_count': retweets,
+                'like_count': likes
+            }
+            for tweet_id, t_idx, u_idx, created, url, retweets, likes in zip(
+                tweet_ids.tolist(), template_idx.tolist(), username_idx.tolist(),
+                created_at.tolist(), urls.tolist(), retweet_counts.tolist(), like_counts.tolist()
+            )
+        ]
         
         return tweets
     
@@ -163,9 +177,9 @@ class TwitterDataCollector:
     def clean_tweet_content(self, content: str) -> str:
         """Clean tweet content by removing URLs, mentions, and extra whitespace."""
         # Remove URLs
-        content = re.sub(r'http\S+|www\S+|https\S+', '', content, flags=re.MULTILINE)
+        content = _URL_RE.sub('', content)
         # Remove mentions and hashtags for cleaner analysis (keep hashtags for keyword extraction)
-        content = re.sub(r'@\w+', '', content)
+        content = _MENTION_RE.sub('', content)
         # Remove extra whitespace
         content = ' '.join(content.split())
         return content.strip()
@@ -1,20 +1,53 @@
 import sqlite3
+import csv
 import pandas as pd
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Union
 import os
+import re
+import threading
+
+# Common words left out of keyword frequency analysis
+_STOP_WORDS = frozenset({'the', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by', 'a', 'an', 'is', 'are', 'was', 'were', 'be', 'been', 'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could', 'should', 'may', 'might', 'must', 'can', 'rt', 'https', 'http'})
 
 class TweetDatabase:
     def __init__(self, db_path: str = "data/tweets.db"):
         self.db_path = db_path
+        self._local = threading.local()
         self.init_database()
     
+    def get_connection(self) -> sqlite3.Connection:
+        """Return this thread's long-lived connection, opening it on first use."""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path)
+            # WAL makes a commit a single append, so a full fsync per write is unnecessary
+            conn.execute("PRAGMA synchronous=NORMAL")
+            # INSERT OR REPLACE only fires the FTS delete trigger with recursive triggers on
+            conn.execute("PRAGMA recursive_triggers=ON")
+            # Connection-scoped stop word table for get_top_keywords
+            conn.execute("CREATE TEMP TABLE IF NOT EXISTS stop_words (word TEXT PRIMARY KEY)")
+            conn.executemany("INSERT OR IGNORE INTO temp.stop_words VALUES (?)",
+                             [(word,) for word in _STOP_WORDS])
+            conn.commit()
+            self._local.conn = conn
+        return conn
+    
+    @staticmethod
+    def _fetch_dicts(conn: sqlite3.Connection, query: str, params: List) -> List[Dict]:
+        """Run a query and return its rows as plain dicts, skipping pandas."""
+        cursor = conn.cursor()
+        cursor.row_factory = sqlite3.Row
+        cursor.execute(query, params)
+        return [dict(row) for row in cursor.fetchall()]
+    
     def init_database(self):
         """Initialize the SQLite database with required tables."""
         os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
         
-        with sqlite3.connect(self.db_path) as conn:
+        with self.get_connection() as conn:
             cursor = conn.cursor()
+            cursor.execute("PRAGMA journal_mode=WAL")
             cursor.execute("""
                 CREATE TABLE IF NOT EXISTS tweets (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -36,96 +69,168 @@ class TweetDatabase:
                 CREATE INDEX IF NOT EXISTS idx_created_at ON tweets(created_at);
             """)
             
+            # Serves keyword filters ordered by date; supersedes the old idx_keyword
             cursor.execute("""
-                CREATE INDEX IF NOT EXISTS idx_keyword ON tweets(keyword);
+                CREATE INDEX IF NOT EXISTS idx_keyword_created ON tweets(keyword, created_at DESC);
             """)
             
+            cursor.execute("DROP INDEX IF EXISTS idx_keyword")
+            
             cursor.execute("""
                 CREATE INDEX IF NOT EXISTS idx_sentiment ON tweets(sentiment);
             """)
             
-            conn.commit()
-    
-    def insert_tweets(self, tweets: List[Dict]):
-        """Insert multiple tweets into the database."""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
+            # Full-text index over content and keyword, kept in sync by triggers
+            cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'tweets_fts'")
+            fts_exists = cursor.fetchone() is not None
+            
+            cursor.execute("""
+                CREATE VIRTUAL TABLE IF NOT EXISTS tweets_fts
+                USING fts5(content, keyword, content='tweets', content_rowid='id')
+            """)
             
-            for tweet in tweets:
-                cursor.execute("""
-                    INSERT OR REPLACE INTO tweets 
-                    (tweet_id, content, username, created_at, keyword, sentiment, 
-                     sentiment_score, positive_score, negative_score, neutral_score)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    tweet.get('tweet_id'),
-                    tweet.get('content'),
-                    tweet.get('username'),
-                    tweet.get('created_at'),
-                    tweet.get('keyword'),
-                    tweet.get('sentiment'),
-                    tweet.get('sentiment_score'),
-                    tweet.get('positive_score'),
-                    tweet.get('negative_score'),
-                    tweet.get('neutral_score')
-                ))
+            cursor.execute("""
+                CREATE VIRTUAL TABLE IF NOT EXISTS tweets_fts_vocab
+                USING fts5vocab(tweets_fts, 'col')
+            """)
+            
+            cursor.execute("""
+                CREATE TRIGGER IF NOT EXISTS tweets_fts_insert AFTER INSERT ON tweets BEGIN
+                    INSERT INTO tweets_fts (rowid, content, keyword)
+                    VALUES (new.id, new.content, new.keyword);
+                END
+            """)
+            
+            cursor.execute("""
+                CREATE TRIGGER IF NOT EXISTS tweets_fts_delete AFTER DELETE ON tweets BEGIN
+                    INSERT INTO tweets_fts (tweets_fts, rowid, content, keyword)
+                    VALUES ('delete', old.id, old.content, old.keyword);
+                END
+            """)
+            
+            cursor.execute("""
+                CREATE TRIGGER IF NOT EXISTS tweets_fts_update AFTER UPDATE ON tweets BEGIN
+                    INSERT INTO tweets_fts (tweets_fts, rowid, content, keyword)
+                    VALUES ('delete', old.id, old.content, old.keyword);
+                    INSERT INTO tweets_fts (rowid, content, keyword)
+                    VALUES (new.id, new.content, new.keyword);
+                END
+            """)
+            
+            if not fts_exists:
+                # Index tweets stored before the full-text table existed
+                cursor.execute("INSERT INTO tweets_fts (tweets_fts) VALUES ('rebuild')")
             
             conn.commit()
     
+    def insert_tweets(self, tweets: List[Dict]):
+        """Insert multiple tweets into the database in a single transaction."""
+        rows = [
+            (
+                tweet.get('tweet_id'),
+                tweet.get('content'),
+                tweet.get('username'),
+                tweet.get('created_at'),
+                tweet.get('keyword'),
+                tweet.get('sentiment'),
+                tweet.get('sentiment_score'),
+                tweet.get('positive_score'),
+                tweet.get('negative_score'),
+                tweet.get('neutral_score')
+            )
+            for tweet in tweets
+        ]
+        
+        with self.get_connection() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            conn.executemany("""
+                INSERT OR REPLACE INTO tweets 
+                (tweet_id, content, username, created_at, keyword, sentiment, 
+                 sentiment_score, positive_score, negative_score, neutral_score)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, rows)
+    
     def get_tweets(self, keyword: Optional[str] = None, 
                    start_date: Optional[datetime] = None,
                    end_date: Optional[datetime] = None,
-                   limit: Optional[int] = None) -> pd.DataFrame:
-        """Retrieve tweets based on filters."""
-        query = "SELECT * FROM tweets WHERE 1=1"
+                   limit: Optional[int] = None,
+                   as_dicts: bool = False,
+                   exact: bool = False) -> Union[pd.DataFrame, List[Dict]]:
+        """Retrieve tweets based on filters, as a DataFrame or a list of row dicts."""
+        query, params = self._build_tweets_query(keyword, start_date, end_date, limit, exact)
+        
+        with self.get_connection() as conn:
+            if as_dicts:
+                return self._fetch_dicts(conn, query, params)
+            # Arrow-backed columns keep strings out of Python objects for grouping;
+            # ISO8601 accepts both sample (naive) and snscrape (tz-aware) timestamps
+            return pd.read_sql_query(query, conn, params=params,
+                                     parse_dates={'created_at': {'format': 'ISO8601', 'utc': True}},
+                                     dtype_backend='pyarrow')
+    
+    def _filter_clause(self, keyword: Optional[str] = None,
+                       start_date: Optional[datetime] = None,
+                       end_date: Optional[datetime] = None,
+                       exact: bool = False):
+        """Build the WHERE conditions and parameters shared by the tweet queries."""
+        where = ""
         params = []
         
-        if keyword:
-            query += " AND keyword LIKE ?"
+        if keyword and exact:
+            # Keyword tweets were collected under; seeks idx_keyword_created
+            where += " AND keyword = ?"
+            params.append(keyword)
+        elif keyword and re.search(r'\w', keyword):
+            # Phrase search on the keyword column, with the last word as a prefix
+            where += " AND id IN (SELECT rowid FROM tweets_fts WHERE tweets_fts MATCH ?)"
+            params.append('keyword : "{}"*'.format(keyword.replace('"', '""')))
+        elif keyword:
+            where += " AND keyword LIKE ?"
             params.append(f"%{keyword}%")
         
         if start_date:
-            query += " AND created_at >= ?"
+            where += " AND created_at >= ?"
             params.append(start_date.isoformat())
         
         if end_date:
-            query += " AND created_at <= ?"
+            where += " AND created_at <= ?"
             params.append(end_date.isoformat())
         
+        return where, params
+    
+    def _build_tweets_query(self, keyword: Optional[str] = None,
+                            start_date: Optional[datetime] = None,
+                            end_date: Optional[datetime] = None,
+                            limit: Optional[int] = None,
+                            exact: bool = False):
+        """Build the filtered tweet SELECT shared by get_tweets and export_to_csv."""
+        where, params = self._filter_clause(keyword, start_date, end_date, exact)
+        query = "SELECT * FROM tweets WHERE 1=1" + where
+        
         query += " ORDER BY created_at DESC"
         
         if limit:
-            query += f" LIMIT {limit}"
+            query += " LIMIT ?"
+            params.append(int(limit))
         
-        with sqlite3.connect(self.db_path) as conn:
-            return pd.read_sql_query(query, conn, params=params)
+        return query, params
     
     def get_sentiment_distribution(self, keyword: Optional[str] = None,
                                  start_date: Optional[datetime] = None,
-                                 end_date: Optional[datetime] = None) -> Dict:
+                                 end_date: Optional[datetime] = None,
+                                 exact: bool = False) -> Dict:
         """Get sentiment distribution counts."""
         query = """
             SELECT sentiment, COUNT(*) as count 
             FROM tweets 
             WHERE 1=1
         """
-        params = []
-        
-        if keyword:
-            query += " AND keyword LIKE ?"
-            params.append(f"%{keyword}%")
-        
-        if start_date:
-            query += " AND created_at >= ?"
-            params.append(start_date.isoformat())
-        
-        if end_date:
-            query += " AND created_at <= ?"
-            params.append(end_date.isoformat())
+        where, params = self._filter_clause(keyword, start_date, end_date, exact)
+        query += where
         
         query += " GROUP BY sentiment"
         
-        with sqlite3.connect(self.db_path) as conn:
+        with self.get_connection() as conn:
             cursor = conn.cursor()
             cursor.execute(query, params)
             results = cursor.fetchall()
@@ -134,64 +239,68 @@ class TweetDatabase:
     
     def get_sentiment_timeline(self, keyword: Optional[str] = None,
                              start_date: Optional[datetime] = None,
-                             end_date: Optional[datetime] = None) -> pd.DataFrame:
-        """Get sentiment trends over time."""
+                             end_date: Optional[datetime] = None,
+                             as_dicts: bool = False,
+                             exact: bool = False) -> Union[pd.DataFrame, List[Dict]]:
+        """Get sentiment trends over time, as a DataFrame or a list of row dicts."""
+        # created_at holds ISO-8601 text, so its first ten characters are the
+        # day; slicing avoids a full date parse per row
         query = """
             SELECT 
-                DATE(created_at) as date,
+                substr(created_at, 1, 10) as date,
                 sentiment,
                 COUNT(*) as count,
                 AVG(sentiment_score) as avg_score
             FROM tweets 
             WHERE 1=1
         """
-        params = []
-        
-        if keyword:
-            query += " AND keyword LIKE ?"
-            params.append(f"%{keyword}%")
-        
-        if start_date:
-            query += " AND created_at >= ?"
-            params.append(start_date.isoformat())
-        
-        if end_date:
-            query += " AND created_at <= ?"
-            params.append(end_date.isoformat())
+        where, params = self._filter_clause(keyword, start_date, end_date, exact)
+        query += where
         
-        query += " GROUP BY DATE(created_at), sentiment ORDER BY date"
+        query += " GROUP BY date, sentiment ORDER BY date"
         
-        with sqlite3.connect(self.db_path) as conn:
+        with self.get_connection() as conn:
+            if as_dicts:
+                return self._fetch_dicts(conn, query, params)
             return pd.read_sql_query(query, conn, params=params)
     
     def get_top_keywords(self, limit: int = 20) -> List[str]:
         """Get most frequent words from tweet content."""
-        query = "SELECT content FROM tweets"
+        # Term counts come straight from the full-text index; keep purely
+        # alphabetic words longer than three characters
+        query = """
+            SELECT term, cnt
+            FROM tweets_fts_vocab
+            WHERE col = 'content'
+              AND length(term) > 3
+              AND term NOT GLOB '*[^a-z]*'
+              AND term NOT IN (SELECT word FROM temp.stop_words)
+            ORDER BY cnt DESC
+            LIMIT ?
+        """
         
-        with sqlite3.connect(self.db_path) as conn:
-            df = pd.read_sql_query(query, conn)
-            
-            if df.empty:
-                return []
-            
-            # Simple word frequency analysis
-            all_text = ' '.join(df['content'].dropna().astype(str))
-            words = all_text.lower().split()
-            
-            # Filter out common words and short words
-            stop_words = {'the', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by', 'a', 'an', 'is', 'are', 'was', 'were', 'be', 'been', 'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could', 'should', 'may', 'might', 'must', 'can', 'rt', 'https', 'http'}
-            
-            word_freq = {}
-            for word in words:
-                if len(word) > 3 and word not in stop_words and word.isalpha():
-                    word_freq[word] = word_freq.get(word, 0) + 1
-            
-            return sorted(word_freq.items(), key=lambda x: x[1], reverse=True)[:limit]
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(query, (limit,))
+            return cursor.fetchall()
     
     def export_to_csv(self, filepath: str, keyword: Optional[str] = None,
                      start_date: Optional[datetime] = None,
                      end_date: Optional[datetime] = None):
-        """Export tweets to CSV file."""
-        df = self.get_tweets(keyword, start_date, end_date)
-        df.to_csv(filepath, index=False)
-        return len(df)
+        """Export tweets to CSV file, streaming rows from the cursor in chunks."""
+        query, params = self._build_tweets_query(keyword, start_date, end_date)
+        count = 0
+        
+        with self.get_connection() as conn, open(filepath, 'w', newline='') as f:
+            writer = csv.writer(f, lineterminator='\n')
+            cursor = conn.execute(query, params)
+            writer.writerow([column[0] for column in cursor.description])
+            
+            while True:
+                rows = cursor.fetchmany(10000)
+                if not rows:
+                    break
+                writer.writerows(rows)
+                count += len(rows)
+        
+        return count
@@ -1,12 +1,34 @@
 from typing import Dict, List
+from functools import lru_cache
 import re
 
+# Patterns stripped by SentimentAnalyzer.preprocess_text
+_URL_RE = re.compile(r'(?:http|www)\S+')
+_MENTION_RE = re.compile(r'@\w+')
+
+# Word lists for SentimentAnalyzer.analyze_sentiment_simple
+_POSITIVE_WORDS = (
+    'good', 'great', 'excellent', 'amazing', 'wonderful', 'fantastic',
+    'awesome', 'brilliant', 'outstanding', 'superb', 'impressive',
+    'thank', 'thanks', 'grateful', 'appreciate', 'love', 'like',
+    'happy', 'pleased', 'satisfied', 'proud', 'success', 'achievement'
+)
+
+_NEGATIVE_WORDS = (
+    'bad', 'terrible', 'awful', 'horrible', 'disappointing', 'frustrated',
+    'angry', 'upset', 'concerned', 'worried', 'problem', 'issue',
+    'fail', 'failure', 'wrong', 'error', 'mistake', 'poor',
+    'hate', 'dislike', 'disgusted', 'annoyed', 'corruption'
+)
+
 class SentimentAnalyzer:
     def __init__(self):
         """
         Initialize the sentiment analyzer with VADER for cloud deployment.
         """
         self.load_vader()
+        # Repeated content (retweets, sample templates) is only analyzed once
+        self._analyze_cached = lru_cache(maxsize=10_000)(self._analyze_uncached)
     
     def load_vader(self):
         """Load VADER sentiment analyzer."""
@@ -21,19 +43,16 @@ class SentimentAnalyzer:
     def preprocess_text(self, text: str) -> str:
         """Preprocess text for sentiment analysis."""
         # Remove URLs
-        text = re.sub(r'http\S+|www\S+|https\S+', '', text, flags=re.MULTILINE)
+        text = _URL_RE.sub('', text)
         
         # Remove user mentions
-        text = re.sub(r'@\w+', '', text)
+        text = _MENTION_RE.sub('', text)
         
         # Remove extra whitespace
         text = ' '.join(text.split())
         
         # Limit length for model input
-        if len(text) > 512:
-            text = text[:512]
-        
-        return text.strip()
+        return text[:512].strip()
     
     
     def analyze_sentiment_vader(self, text: str) -> Dict:
@@ -73,22 +92,8 @@ class SentimentAnalyzer:
         """Simple rule-based sentiment analysis as last resort."""
         text = text.lower()
         
-        positive_words = [
-            'good', 'great', 'excellent', 'amazing', 'wonderful', 'fantastic', 
-            'awesome', 'brilliant', 'outstanding', 'superb', 'impressive',
-            'thank', 'thanks', 'grateful', 'appreciate', 'love', 'like',
-            'happy', 'pleased', 'satisfied', 'proud', 'success', 'achievement'
-        ]
-        
-        negative_words = [
-            'bad', 'terrible', 'awful', 'horrible', 'disappointing', 'frustrated',
-            'angry', 'upset', 'concerned', 'worried', 'problem', 'issue',
-            'fail', 'failure', 'wrong', 'error', 'mistake', 'poor',
-            'hate', 'dislike', 'disgusted', 'annoyed', 'corruption'
-        ]
-        
-        positive_count = sum(1 for word in positive_words if word in text)
-        negative_count = sum(1 for word in negative_words if word in text)
+        positive_count = len([word for word in _POSITIVE_WORDS if word in text])
+        negative_count = len([word for word in _NEGATIVE_WORDS if word in text])
         
         if positive_count > negative_count:
             sentiment = 'positive'
@@ -123,6 +128,11 @@ class SentimentAnalyzer:
         if not text or not text.strip():
             return self.get_neutral_sentiment()
         
+        # Copy so callers can update the result without touching the cache
+        return dict(self._analyze_cached(text))
+    
+    def _analyze_uncached(self, text: str) -> Dict:
+        """Analyze non-empty text with VADER or the rule-based fallback."""
         # Use VADER or fallback to simple analysis
         if hasattr(self, 'vader_analyzer') and self.vader_analyzer:
             return self.analyze_sentiment_vader(text)
@@ -130,8 +140,6 @@ class SentimentAnalyzer:
             return self.analyze_sentiment_simple(text)
     
     def analyze_batch(self, texts: List[str]) -> List[Dict]:
-        """Analyze sentiment for a batch of texts."""
-        results = []
-        for text in texts:
-            results.append(self.analyze_sentiment(text))
-        return results
+        """Analyze sentiment for a batch of texts, scoring each distinct text once."""
+        unique_results = {text: self.analyze_sentiment(text) for text in dict.fromkeys(texts)}
+        return [dict(unique_results[text]) for text in texts]
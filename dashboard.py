@@ -9,6 +9,7 @@ import json
 # Removed wordcloud and matplotlib for cloud deployment compatibility
 import io
 import base64
+import math
 
 # Import backend modules
 import sys
@@ -35,24 +36,6 @@ st.markdown("""
         color: #1f77b4;
         margin-bottom: 2rem;
     }
-    .metric-card {
-        background-color: #f0f2f6;
-        padding: 1rem;
-        border-radius: 0.5rem;
-        margin: 0.5rem 0;
-    }
-    .sentiment-positive {
-        color: #28a745;
-        font-weight: bold;
-    }
-    .sentiment-negative {
-        color: #dc3545;
-        font-weight: bold;
-    }
-    .sentiment-neutral {
-        color: #6c757d;
-        font-weight: bold;
-    }
 </style>
 """, unsafe_allow_html=True)
 
@@ -93,6 +76,13 @@ start_date = st.sidebar.date_input("Start Date", (datetime.now() - timedelta(day
 start_datetime = datetime.combine(start_date, datetime.min.time())
 end_datetime = datetime.combine(end_date, datetime.max.time())
 
+@st.cache_data(ttl=60, show_spinner=False)
+def load_data(keyword, start_datetime, end_datetime):
+    """Load data from database with the given filters, cached across reruns."""
+    df = db.get_tweets(keyword=keyword, start_date=start_datetime, end_date=end_datetime, limit=1000)
+    df['date'] = df['created_at'].dt.date
+    return df
+
 # Action buttons
 if st.sidebar.button("🔄 Collect New Tweets", type="primary"):
     with st.spinner("Collecting and analyzing tweets..."):
@@ -101,18 +91,22 @@ if st.sidebar.button("🔄 Collect New Tweets", type="primary"):
             tweets = collector.collect_tweets(keyword, max_tweets, days_back)
             
             if tweets:
-                # Analyze sentiment
+                # Analyze sentiment in batches, updating progress every 10%
                 analyzed_tweets = []
                 progress_bar = st.progress(0)
+                batch_size = max(1, math.ceil(len(tweets) / 10))
                 
-                for i, tweet in enumerate(tweets):
-                    sentiment_result = analyzer.analyze_sentiment(tweet['content'])
-                    tweet.update(sentiment_result)
-                    analyzed_tweets.append(tweet)
-                    progress_bar.progress((i + 1) / len(tweets))
+                for start in range(0, len(tweets), batch_size):
+                    batch = tweets[start:start + batch_size]
+                    sentiment_results = analyzer.analyze_batch([tweet['content'] for tweet in batch])
+                    for tweet, sentiment_result in zip(batch, sentiment_results):
+                        tweet.update(sentiment_result)
+                        analyzed_tweets.append(tweet)
+                    progress_bar.progress(len(analyzed_tweets) / len(tweets))
                 
                 # Store in database
                 db.insert_tweets(analyzed_tweets)
+                load_data.clear()
                 
                 st.sidebar.success(f"✅ Collected {len(analyzed_tweets)} tweets!")
                 st.rerun()
@@ -132,13 +126,8 @@ if st.sidebar.button("📥 Export to CSV"):
     except Exception as e:
         st.sidebar.error(f"❌ Export error: {str(e)}")
 
-# Main dashboard content
-def load_data():
-    """Load data from database with current filters."""
-    return db.get_tweets(keyword=keyword, start_date=start_datetime, end_date=end_datetime, limit=1000)
-
 # Load data
-df = load_data()
+df = load_data(keyword, start_datetime, end_datetime)
 
 if df.empty:
     st.warning("📭 No data available. Please collect some tweets first using the sidebar.")
@@ -193,7 +182,6 @@ else:
     with col2:
         st.subheader("📅 Sentiment Timeline")
         # Create timeline data
-        df['date'] = pd.to_datetime(df['created_at']).dt.date
         timeline_data = df.groupby(['date', 'sentiment']).size().reset_index(name='count')
         
         if not timeline_data.empty:
@@ -275,37 +263,29 @@ else:
     # Recent tweets feed
     st.subheader("📋 Recent Tweets Feed")
     
-    # Display recent tweets with sentiment colors
+    # Display recent tweets with sentiment colors in a single table
     recent_tweets = df.head(20)
+    sentiment_emojis = {'positive': '😊', 'negative': '😞', 'neutral': '😐'}
+    sentiment_colors = {'positive': '#28a745', 'negative': '#dc3545', 'neutral': '#6c757d'}
     
-    for _, tweet in recent_tweets.iterrows():
-        sentiment = tweet['sentiment']
-        sentiment_class = f"sentiment-{sentiment}"
-        
-        # Format the tweet display
-        col1, col2, col3 = st.columns([1, 6, 1])
-        
-        with col1:
-            if sentiment == 'positive':
-                st.markdown("😊")
-            elif sentiment == 'negative':
-                st.markdown("😞")
-            else:
-                st.markdown("😐")
-        
-        with col2:
-            st.markdown(f"""
-            <div class="metric-card">
-                <strong>@{tweet['username']}</strong> • {pd.to_datetime(tweet['created_at']).strftime('%Y-%m-%d %H:%M')}
-                <br>
-                {tweet['content'][:200]}{'...' if len(tweet['content']) > 200 else ''}
-                <br>
-                <span class="{sentiment_class}">Sentiment: {sentiment.title()} ({tweet['sentiment_score']:.2f})</span>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        with col3:
-            st.markdown(f"**{tweet['sentiment_score']:.2f}**")
+    feed = pd.DataFrame({
+        '': recent_tweets['sentiment'].map(sentiment_emojis),
+        'User': '@' + recent_tweets['username'].fillna(''),
+        'Posted': recent_tweets['created_at'].dt.strftime('%Y-%m-%d %H:%M'),
+        'Tweet': recent_tweets['content'],
+        'Sentiment': recent_tweets['sentiment'].str.title(),
+        'Score': recent_tweets['sentiment_score']
+    })
+    
+    def color_sentiment(column):
+        return [f"color: {sentiment_colors.get(str(value).lower(), '#6c757d')}; font-weight: bold"
+                for value in column]
+    
+    st.dataframe(
+        feed.style.apply(color_sentiment, subset=['Sentiment']).format({'Score': '{:.2f}'}),
+        use_container_width=True,
+        hide_index=True
+    )
 
 # Footer
 st.markdown("---")